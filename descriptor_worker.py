@@ -0,0 +1,65 @@
+"""
+RDKit descriptor calculation for the descriptor process pool
+
+Kept apart from main.py so forkserver workers only import NumPy and RDKit,
+not the FastAPI app and everything it pulls in.
+"""
+
+import numpy as np
+
+# Morgan fingerprint size
+FP_BITS = 2048
+
+def init_worker():
+    """Import RDKit once per worker so the first request doesn't pay for it"""
+    try:
+        import rdkit.Chem
+    except ImportError:
+        pass
+
+def scalar_descriptors(mol) -> tuple:
+    """Basic RDKit descriptors for a molecule, in DESCRIPTOR_NAMES order"""
+    from rdkit.Chem import Descriptors, Crippen, Lipinski
+
+    return (
+        Descriptors.ExactMolWt(mol),
+        Crippen.MolLogP(mol),
+        Lipinski.NumHAcceptors(mol),
+        Lipinski.NumHDonors(mol),
+        Descriptors.TPSA(mol),
+        Lipinski.NumRotatableBonds(mol),
+        Lipinski.RingCount(mol),
+        Lipinski.FractionCsp3(mol),
+        Descriptors.BalabanJ(mol),
+        Descriptors.BertzCT(mol)
+    )
+
+def compute_descriptors(smiles: str) -> tuple:
+    """Compute (scalar descriptors, packed fingerprint bits) for a SMILES string"""
+    from rdkit import Chem, DataStructs
+    from rdkit.Chem.rdMolDescriptors import GetMorganFingerprintAsBitVect
+
+    # Create molecule from SMILES
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        raise ValueError("Invalid SMILES string")
+
+    scalars = scalar_descriptors(mol)
+
+    # Calculate Morgan fingerprint bits straight into a NumPy array
+    fp = GetMorganFingerprintAsBitVect(mol, 2, nBits=FP_BITS)
+    fp_array = np.zeros(FP_BITS, dtype=np.int8)
+    DataStructs.ConvertToNumpyArray(fp, fp_array)
+
+    # Bits are packed (256 bytes) for a cheap return trip and compact caching
+    return scalars, np.packbits(fp_array)
+
+def compute_scalar_descriptors(smiles: str) -> tuple:
+    """Compute (scalar descriptors, RDKit binary molecule) for the GPU fingerprint path"""
+    from rdkit import Chem
+
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        raise ValueError("Invalid SMILES string")
+
+    return scalar_descriptors(mol), mol.ToBinary()
@@ -28,15 +28,33 @@ import numpy as np
 import pandas as pd
 import joblib
 import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
 import aiohttp
-from urllib.parse import quote
+import orjson
+import yarl
 from fastapi.staticfiles import StaticFiles
 from huggingface_hub import hf_hub_download
+from descriptor_worker import FP_BITS, compute_descriptors, compute_scalar_descriptors, init_worker
 import joblib
 import logging
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the JIT-decorated helpers run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 loaded_models = {}
 
@@ -65,7 +83,8 @@ app.add_middleware(
 # API Configuration
 NCI_CONFIG = {
     "baseUrl": "https://cactus.nci.nih.gov/chemical/structure",
-    "timeout": 5000
+    "timeout": 5000,
+    "maxConcurrency": 10
 }
 
 USDA_CONFIG = {
@@ -73,9 +92,23 @@ USDA_CONFIG = {
     "baseUrl": "https://api.nal.usda.gov/fdc/v1/",
     "searchEndpoint": "foods/search",
     "detailEndpoint": "food",
-    "timeout": 8000
+    "timeout": 8000,
+    "maxConcurrency": 10
 }
 
+# Optional GPU fingerprint path (falls back to RDKit when unavailable)
+USE_NVMOLKIT = os.getenv("USE_NVMOLKIT", "").lower() in ("1", "true", "yes")
+
+# Pre-parsed endpoint URLs (built once rather than formatted per request)
+NCI_URL = yarl.URL(NCI_CONFIG['baseUrl'])
+USDA_SEARCH_URL = yarl.URL(USDA_CONFIG['baseUrl'] + USDA_CONFIG['searchEndpoint'])
+USDA_DETAIL_URL = yarl.URL(USDA_CONFIG['baseUrl'] + USDA_CONFIG['detailEndpoint'])
+USDA_DETAIL_PARAMS = {"api_key": USDA_CONFIG['key']}
+
+# Cap in-flight requests per upstream service to stay under rate limits
+nci_semaphore = asyncio.Semaphore(NCI_CONFIG['maxConcurrency'])
+usda_semaphore = asyncio.Semaphore(USDA_CONFIG['maxConcurrency'])
+
 # Request/Response Models
 class DrugRequest(BaseModel):
     drug_name: str
@@ -140,6 +173,170 @@ class InteractionResult(BaseModel):
 # Global variables for loaded models
 loaded_models = {}
 
+class AsyncTTLCache:
+    """LRU cache with a time-to-live for coroutine results, keyed on positional args
+
+    Concurrent misses on the same key share one in-flight call, so a burst of
+    identical lookups reaches the upstream service only once.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 24 * 60 * 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._in_flight = {}
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        async def wrapper(*args):
+            value = self.get(args)
+            if value is not None:
+                return value
+
+            task = self._in_flight.get(args)
+            if task is None:
+                task = asyncio.ensure_future(func(*args))
+                self._in_flight[args] = task
+                task.add_done_callback(functools.partial(self._store_result, args))
+
+            # Shield so one cancelled caller doesn't cancel the call for the others
+            return await asyncio.shield(task)
+
+        wrapper.cache = self
+        return wrapper
+
+    def _store_result(self, key, task: asyncio.Future):
+        # Only successful results are stored; exceptions propagate uncached
+        self._in_flight.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result())
+
+    def get(self, key):
+        """Return the live entry for key (refreshing its LRU position), or None"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        # Drop expired entries first so size reflects live entries only
+        now = time.monotonic()
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+            "in_flight": len(self._in_flight),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl
+        }
+
+class MicroBatcher:
+    """Coalesces concurrent single-item requests into one call of a batch function
+
+    process_batch takes a list of items and returns one result per item; it runs
+    in a worker thread so the event loop stays free.
+    """
+
+    def __init__(self, process_batch: Callable[[List], Sequence], max_batch: int = 64, max_wait: float = 0.005):
+        self.process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background task; anything still queued fails instead of hanging"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._fail(pending, RuntimeError("Batcher stopped"))
+
+    async def submit(self, item):
+        """Queue one item and wait for its result"""
+        if self._task is None:
+            raise RuntimeError("Batcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    @staticmethod
+    def _fail(batch: List, error: BaseException):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Wait for one item, then gather more until max_batch or max_wait is hit
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                results = await asyncio.to_thread(self.process_batch, [item for item, _ in batch])
+            except asyncio.CancelledError:
+                self._fail(batch, RuntimeError("Batcher stopped"))
+                raise
+            except Exception as e:
+                self._fail(batch, e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+def _predict_proba_rows(rows: List[np.ndarray]) -> np.ndarray:
+    """Run the classifier once over a stack of feature rows"""
+    return loaded_models['xgb_model'].predict_proba(np.vstack(rows))
+
+def _predict_label_rows(rows: List[np.ndarray]) -> np.ndarray:
+    """Run the classifier once over a stack of feature rows, returning class indices only"""
+    return loaded_models['xgb_model'].predict(np.vstack(rows))
+
+prediction_batcher = MicroBatcher(_predict_proba_rows, max_batch=64, max_wait=0.005)
+
+def normalize_name(name: str) -> str:
+    """Normalize a drug/food name so equivalent queries share cache entries"""
+    return name.strip().lower()
+
 def load_models():
     try:
         # Download from Hugging Face Hub dynamically
@@ -152,6 +349,7 @@ def load_models():
         loaded_models['feature_order'] = joblib.load(
             hf_hub_download(repo_id="asritha22bce/FoodDrugInteraction", filename="models/feature_order.joblib")
         )
+        loaded_models['feature_index'] = build_feature_index(loaded_models['feature_order'])
 
         logger.info("Models loaded successfully from Hugging Face Hub")
         return True
@@ -163,71 +361,234 @@ def load_models():
 @app.on_event("startup")
 async def startup_event():
     """Initialize models on startup"""
+    global descriptor_batcher
+
     success = load_models()
     if not success:
         logger.warning("Failed to load models. Predictions will use fallback logic.")
 
+    # Random pools backing the mock descriptor/nutrient fallbacks
+    _init_mock_pools()
+
+    # Compile the Numba fallback scorer now rather than on the first fallback request
+    _score_fallback(np.zeros(2, dtype=np.float32), 0, 1)
+
+    # Shared HTTP session so NCI/USDA calls reuse pooled keep-alive connections
+    app.state.session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60),
+        timeout=aiohttp.ClientTimeout(total=10)
+    )
+
+    # Background task that batches concurrent model predictions
+    prediction_batcher.start()
+
+    # Worker processes for RDKit descriptor calculation; a failed start is not
+    # fatal since the request path rebuilds the pool (and has mock fallbacks)
+    try:
+        await _start_descriptor_executor()
+    except Exception as e:
+        logger.error(f"Failed to start descriptor process pool: {e}")
+
+    # Optional GPU batching of fingerprint calculation
+    if USE_NVMOLKIT:
+        if _nvmolkit_available():
+            descriptor_batcher = MicroBatcher(_compute_fingerprints_gpu, max_batch=256, max_wait=0.005)
+            descriptor_batcher.start()
+            logger.info("Using nvMolKit for batched fingerprint calculation")
+        else:
+            logger.warning("USE_NVMOLKIT is set but nvMolKit/CUDA is unavailable; using RDKit")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown"""
+    await prediction_batcher.stop()
+    if descriptor_batcher is not None:
+        await descriptor_batcher.stop()
+    await app.state.session.close()
+    if descriptor_executor is not None:
+        descriptor_executor.shutdown(wait=False, cancel_futures=True)
+
 async def get_canonical_smiles(drug_name: str) -> str:
-    """Get canonical SMILES from NCI Chemical Identifier Resolver"""
+    """Get canonical SMILES from NCI Chemical Identifier Resolver (cached)"""
+    return await fetch_canonical_smiles(normalize_name(drug_name))
+
+@AsyncTTLCache(maxsize=4096)
+async def fetch_canonical_smiles(drug_name: str) -> str:
+    """Query NCI for canonical SMILES; expects an already-normalized name"""
     try:
-        # URL encode the drug name
-        encoded_name = quote(drug_name)
-        url = f"{NCI_CONFIG['baseUrl']}/{encoded_name}/canonical_smiles"
-
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    smiles = await response.text()
-                    return smiles.strip()
-                else:
+        # yarl quotes the drug name as a path segment
+        url = NCI_URL / drug_name / "canonical_smiles"
+
+        session = app.state.session
+        async with nci_semaphore:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status != 200:
                     raise HTTPException(status_code=404, detail=f"Drug '{drug_name}' not found in NCI database")
+
+                # NCI returns a single line; read just that line's bytes
+                line = await response.content.readline()
+                return line.decode('ascii', 'ignore').strip()
     except asyncio.TimeoutError:
         raise HTTPException(status_code=408, detail="NCI API timeout")
     except Exception as e:
         logger.error(f"Error getting canonical SMILES for {drug_name}: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving drug information: {str(e)}")
 
-def calculate_molecular_descriptors(smiles: str) -> Dict:
-    """Calculate molecular descriptors using RDKit"""
-    try:
-        from rdkit import Chem
-        from rdkit.Chem import Descriptors, Crippen, Lipinski
-        from rdkit.Chem.rdMolDescriptors import GetMorganFingerprint
-
-        # Create molecule from SMILES
-        mol = Chem.MolFromSmiles(smiles)
-        if mol is None:
-            raise ValueError("Invalid SMILES string")
-
-        # Calculate basic descriptors
-        descriptors = {
-            'MolWt': Descriptors.ExactMolWt(mol),
-            'LogP': Crippen.MolLogP(mol),
-            'HBA': Lipinski.NumHAcceptors(mol),
-            'HBD': Lipinski.NumHDonors(mol),
-            'TPSA': Descriptors.TPSA(mol),
-            'RotBonds': Lipinski.NumRotatableBonds(mol),
-            'RingCount': Lipinski.RingCount(mol),
-            'FractionCSP3': Lipinski.FractionCsp3(mol),
-            'BalabanJ': Descriptors.BalabanJ(mol),
-            'BertzCT': Descriptors.BertzCT(mol)
-        }
+# Scalar descriptor names in model/feature order
+DESCRIPTOR_NAMES = (
+    'MolWt', 'LogP', 'HBA', 'HBD', 'TPSA',
+    'RotBonds', 'RingCount', 'FractionCSP3', 'BalabanJ', 'BertzCT'
+)
 
-        # Calculate Morgan fingerprint (FP_0 to FP_2047)
-        fp = GetMorganFingerprint(mol, radius=2, nBits=2048)
-        fp_array = np.zeros(2048)
+# Descriptors that are integer counts
+INT_DESCRIPTORS = ('HBA', 'HBD', 'RotBonds', 'RingCount')
 
-        # Convert fingerprint to array
-        for idx, val in fp.GetNonzeroElements().items():
-            if idx < 2048:
-                fp_array[idx] = val
+# Morgan fingerprint feature names (FP_0 to FP_2047)
+FP_FEATURE_NAMES = tuple(f'FP_{i}' for i in range(FP_BITS))
 
-        # Add fingerprint features
-        for i in range(2048):
-            descriptors[f'FP_{i}'] = fp_array[i]
+# Drug features in the order produced by DrugDescriptors.as_vector()
+DRUG_FEATURE_NAMES = DESCRIPTOR_NAMES + FP_FEATURE_NAMES
+DRUG_FEATURE_INDEX = {name: i for i, name in enumerate(DRUG_FEATURE_NAMES)}
 
+@dataclass
+class DrugDescriptors:
+    """Scalar RDKit descriptors plus the Morgan fingerprint as a uint8 bit array"""
+    scalars: Dict[str, float]
+    fp: np.ndarray
+    is_mock: bool = False
+
+    def as_vector(self) -> np.ndarray:
+        """Float32 drug feature vector: scalars in DESCRIPTOR_NAMES order followed by the fingerprint"""
+        scalar_vec = np.array([self.scalars[name] for name in DESCRIPTOR_NAMES], dtype=np.float32)
+        return np.concatenate([scalar_vec, self.fp])
+
+    def to_dict(self) -> Dict:
+        """Flat name -> value mapping (only built when per-name values are needed)"""
+        descriptors = dict(self.scalars)
+        descriptors.update(zip(FP_FEATURE_NAMES, self.fp.tolist()))
         return descriptors
 
+@functools.lru_cache(maxsize=1)
+def _nvmolkit_fingerprint_generator():
+    from nvmolkit.fingerprints import MorganFingerprintGenerator
+    return MorganFingerprintGenerator(radius=2, fpSize=FP_BITS)
+
+def _compute_fingerprints_gpu(mol_binaries: List[bytes]) -> List[np.ndarray]:
+    """Packed Morgan fingerprints for a batch of molecules, computed on the GPU with nvMolKit
+
+    Takes RDKit binary molecules from compute_scalar_descriptors, so SMILES
+    parsing and the scalar descriptors stay in the process pool and only
+    the fingerprint runs in the server process.
+    """
+    from rdkit import Chem
+
+    mols = [Chem.Mol(mol_binary) for mol_binary in mol_binaries]
+
+    # nvMolKit returns (n, FP_BITS / 32) uint32 words, least significant bit first;
+    # re-pack into the same np.packbits layout compute_descriptors produces
+    words = _nvmolkit_fingerprint_generator().GetFingerprints(mols).numpy()
+    bits = np.unpackbits(words.astype('<u4').view(np.uint8), axis=1, bitorder='little')
+    return [row.copy() for row in np.packbits(bits, axis=1)]
+
+def _nvmolkit_available() -> bool:
+    """True if nvMolKit imports and a CUDA device is visible"""
+    try:
+        import nvmolkit.fingerprints
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (honours cpusets/affinity, unlike os.cpu_count())"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+# Process pool for RDKit work and optional GPU batcher (created on startup).
+# DESCRIPTOR_WORKERS overrides the pool size, e.g. to match a container CPU quota.
+DESCRIPTOR_WORKERS = int(os.getenv("DESCRIPTOR_WORKERS", "0")) or _available_cpus()
+descriptor_executor = None
+descriptor_batcher = None
+
+def _create_descriptor_executor() -> ProcessPoolExecutor:
+    """Process pool for RDKit work
+
+    Workers come from a forkserver rather than fork(): by the time they start,
+    the server process already runs threads (aiohttp resolver, to_thread
+    workers) that may hold locks a forked child would inherit. The forkserver
+    preloads only descriptor_worker and RDKit, never this module.
+    """
+    mp_context = multiprocessing.get_context("forkserver")
+    mp_context.set_forkserver_preload(["descriptor_worker", "rdkit.Chem"])
+    return ProcessPoolExecutor(
+        max_workers=DESCRIPTOR_WORKERS,
+        mp_context=mp_context,
+        initializer=init_worker
+    )
+
+async def _start_descriptor_executor():
+    """Create the descriptor pool and spawn its workers now instead of on the first request"""
+    global descriptor_executor
+    descriptor_executor = _create_descriptor_executor()
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[
+        loop.run_in_executor(descriptor_executor, init_worker)
+        for _ in range(DESCRIPTOR_WORKERS)
+    ])
+
+async def _run_in_descriptor_pool(func: Callable, smiles: str) -> tuple:
+    """Run a descriptor_worker function in the process pool, replacing the pool if a worker died"""
+    global descriptor_executor
+    loop = asyncio.get_running_loop()
+    executor = descriptor_executor
+    try:
+        if executor is None:
+            raise BrokenProcessPool("Descriptor process pool was never started")
+        return await loop.run_in_executor(executor, func, smiles)
+    except BrokenProcessPool:
+        # A dead worker breaks the whole pool; without a restart every later
+        # request would fall back to mock descriptors
+        logger.error("Descriptor process pool is broken; restarting it")
+        if descriptor_executor is executor:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            descriptor_executor = _create_descriptor_executor()
+        return await loop.run_in_executor(descriptor_executor, func, smiles)
+
+@AsyncTTLCache(maxsize=2048)
+async def _calc_descriptors_cached(smiles: str) -> tuple:
+    """Memoized descriptor calculation (GPU batch or RDKit process pool); raises on failure so errors are not cached"""
+    global descriptor_batcher
+
+    batcher = descriptor_batcher
+    if batcher is not None:
+        # Scalars stay on the CPU pool; only the fingerprint is batched on the GPU
+        scalars, mol_binary = await _run_in_descriptor_pool(compute_scalar_descriptors, smiles)
+        try:
+            fp_packed = await batcher.submit(mol_binary)
+        except Exception as e:
+            # Remember the failure: later calls go straight to RDKit instead of
+            # paying the batch wait and a warning each time
+            if descriptor_batcher is batcher:
+                logger.warning(f"nvMolKit batch failed, disabling GPU path and using RDKit: {e}")
+                descriptor_batcher = None
+                await batcher.stop()
+        else:
+            fp_packed.setflags(write=False)
+            return scalars, fp_packed
+
+    scalars, fp_packed = await _run_in_descriptor_pool(compute_descriptors, smiles)
+
+    # Shared between callers through the cache, so read-only
+    fp_packed.setflags(write=False)
+    return scalars, fp_packed
+
+async def calculate_molecular_descriptors(smiles: str) -> DrugDescriptors:
+    """Calculate molecular descriptors using RDKit (memoized by SMILES)"""
+    try:
+        scalars, fp_packed = await _calc_descriptors_cached(smiles)
     except ImportError:
         # Fallback if RDKit is not available
         logger.warning("RDKit not available, using mock descriptors")
@@ -236,228 +597,414 @@ def calculate_molecular_descriptors(smiles: str) -> Dict:
         logger.error(f"Error calculating molecular descriptors: {e}")
         return get_mock_molecular_descriptors()
 
-def get_mock_molecular_descriptors() -> Dict:
-    """Mock molecular descriptors for testing"""
-    descriptors = {
-        'MolWt': np.random.uniform(100, 500),
-        'LogP': np.random.uniform(-2, 5),
-        'HBA': np.random.randint(1, 10),
-        'HBD': np.random.randint(0, 5),
-        'TPSA': np.random.uniform(20, 140),
-        'RotBonds': np.random.randint(0, 10),
-        'RingCount': np.random.randint(0, 4),
-        'FractionCSP3': np.random.uniform(0, 1),
-        'BalabanJ': np.random.uniform(0.5, 2.5),
-        'BertzCT': np.random.uniform(100, 1000)
-    }
+    return DrugDescriptors(
+        scalars=dict(zip(DESCRIPTOR_NAMES, scalars)),
+        fp=np.unpackbits(fp_packed)
+    )
+
+# Mock data ranges: name -> (low, high); INT_DESCRIPTORS use an exclusive high
+MOCK_DESCRIPTOR_RANGES = {
+    'MolWt': (100, 500),
+    'LogP': (-2, 5),
+    'HBA': (1, 10),
+    'HBD': (0, 5),
+    'TPSA': (20, 140),
+    'RotBonds': (0, 10),
+    'RingCount': (0, 4),
+    'FractionCSP3': (0, 1),
+    'BalabanJ': (0.5, 2.5),
+    'BertzCT': (100, 1000)
+}
+
+MOCK_NUTRIENT_RANGES = {
+    # Basic macronutrients
+    'Fat': (0, 15),
+    'Carbohydrates': (0, 40),
+    'Protein': (0, 20),
+
+    # Vitamins with realistic ranges
+    'Vitamin_C_mg': (0, 200),
+    'Vitamin_D_ug': (0, 25),
+    'Vitamin_B12_ug': (0, 10),
+    'Vitamin_B6_mg': (0, 5),
+    'Vitamin_A_ug': (0, 1500),
+    'Vitamin_E_mg': (0, 30),
+    'Vitamin_K_ug': (0, 500),
+    'Folate_ug': (0, 300),
 
-    # Add mock fingerprint features
-    for i in range(2048):
-        descriptors[f'FP_{i}'] = np.random.randint(0, 2)
+    # Minerals
+    'Calcium': (0, 250),
+    'Iron': (0, 15),
+    'Magnesium': (0, 150),
+    'Potassium': (0, 800),
+    'Sodium': (0, 200),
+    'Zinc': (0, 8),
 
-    return descriptors
+    # Fat breakdown
+    'Saturated_Fat_g': (0, 10),
+    'Monounsaturated_Fat_g': (0, 8),
+    'Polyunsaturated_Fat_g': (0, 6),
+    'Cholesterol_mg': (0, 300),
+}
 
-async def search_food_nutrients(food_name: str) -> Dict:
-    """Search for food and get comprehensive nutritional information from USDA API"""
-    try:
-        # Search for food
-        search_url = f"{USDA_CONFIG['baseUrl']}{USDA_CONFIG['searchEndpoint']}"
-        search_params = {
-            "api_key": USDA_CONFIG['key'],
-            "query": food_name,
-            "pageSize": 1
-        }
+MOCK_POOL_SIZE = 1024
 
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=8)) as session:
-            # Search for food
-            async with session.get(search_url, params=search_params) as response:
-                if response.status != 200:
-                    raise HTTPException(status_code=404, detail=f"Food '{food_name}' not found")
+# Precomputed random rows handed out by the mock generators
+mock_pools = {}
 
-                search_data = await response.json()
-                if not search_data.get('foods'):
-                    raise HTTPException(status_code=404, detail=f"Food '{food_name}' not found")
+def _init_mock_pools():
+    """Pre-generate pools of mock descriptors, fingerprints and nutrients"""
+    rng = np.random.default_rng()
 
-                # Get first food item
-                food_item = search_data['foods'][0]
-                fdc_id = food_item['fdcId']
+    descriptor_columns = []
+    for name, (low, high) in MOCK_DESCRIPTOR_RANGES.items():
+        if name in INT_DESCRIPTORS:
+            descriptor_columns.append(rng.integers(low, high, size=MOCK_POOL_SIZE))
+        else:
+            descriptor_columns.append(rng.uniform(low, high, size=MOCK_POOL_SIZE))
+
+    nutrient_lows, nutrient_highs = zip(*MOCK_NUTRIENT_RANGES.values())
 
-                # Get detailed nutrition information
-                detail_url = f"{USDA_CONFIG['baseUrl']}{USDA_CONFIG['detailEndpoint']}/{fdc_id}"
-                detail_params = {"api_key": USDA_CONFIG['key']}
+    mock_pools['rng'] = rng
+    mock_pools['descriptors'] = np.column_stack(descriptor_columns)
+    mock_pools['fingerprints'] = rng.integers(0, 2, size=(MOCK_POOL_SIZE, FP_BITS), dtype=np.uint8)
+    mock_pools['nutrients'] = rng.uniform(nutrient_lows, nutrient_highs, size=(MOCK_POOL_SIZE, len(MOCK_NUTRIENT_RANGES)))
 
-                async with session.get(detail_url, params=detail_params) as detail_response:
-                    if detail_response.status != 200:
-                        raise HTTPException(status_code=404, detail="Food details not found")
+def _mock_pool_row(pool_name: str) -> np.ndarray:
+    """Pick a random row from a mock pool, building the pools on first use"""
+    if not mock_pools:
+        _init_mock_pools()
+    pool = mock_pools[pool_name]
+    return pool[mock_pools['rng'].integers(len(pool))]
 
-                    detail_data = await detail_response.json()
+def get_mock_molecular_descriptors() -> DrugDescriptors:
+    """Mock molecular descriptors for testing"""
+    values = _mock_pool_row('descriptors').tolist()
+    scalars = {
+        name: int(value) if name in INT_DESCRIPTORS else value
+        for name, value in zip(MOCK_DESCRIPTOR_RANGES, values)
+    }
 
-                    # Extract nutrients
-                    nutrients = extract_comprehensive_nutrients(detail_data.get('foodNutrients', []))
-                    return nutrients
+    # Mock fingerprint bits
+    fp = _mock_pool_row('fingerprints').copy()
 
+    return DrugDescriptors(scalars=scalars, fp=fp, is_mock=True)
+
+async def search_food_nutrients(food_name: str) -> Dict:
+    """Search for food and get comprehensive nutritional information from USDA API (cached)"""
+    nutrients, _ = await resolve_food_nutrients(food_name)
+    return nutrients
+
+async def resolve_food_nutrients(food_name: str) -> tuple:
+    """Return (nutrients, from_usda); from_usda is False when the mock fallback was used"""
+    try:
+        return await fetch_food_nutrients(normalize_name(food_name)), True
     except asyncio.TimeoutError:
         raise HTTPException(status_code=408, detail="USDA API timeout")
     except Exception as e:
         logger.error(f"Error getting food nutrients for {food_name}: {e}")
-        # Return mock nutrients as fallback
-        return get_mock_comprehensive_nutrients()
+        # Return mock nutrients as fallback (never cached)
+        return get_mock_comprehensive_nutrients(), False
+
+@AsyncTTLCache(maxsize=4096)
+async def fetch_food_nutrients(food_name: str) -> Dict:
+    """Query USDA for a food's nutrients; expects an already-normalized name"""
+    # Search for food
+    search_params = {
+        "api_key": USDA_CONFIG['key'],
+        "query": food_name,
+        "pageSize": 1
+    }
+
+    session = app.state.session
+    timeout = aiohttp.ClientTimeout(total=8)
+
+    # Search for food (the connection is released before the detail request)
+    async with usda_semaphore:
+        async with session.get(USDA_SEARCH_URL, params=search_params, timeout=timeout) as response:
+            if response.status != 200:
+                raise HTTPException(status_code=404, detail=f"Food '{food_name}' not found")
+
+            search_data = orjson.loads(await response.read())
+
+    if not search_data.get('foods'):
+        raise HTTPException(status_code=404, detail=f"Food '{food_name}' not found")
+
+    # Get first food item
+    food_item = search_data['foods'][0]
+    fdc_id = food_item['fdcId']
+
+    # Get detailed nutrition information
+    detail_url = USDA_DETAIL_URL / str(fdc_id)
+    async with usda_semaphore:
+        async with session.get(detail_url, params=USDA_DETAIL_PARAMS, timeout=timeout) as detail_response:
+            if detail_response.status != 200:
+                raise HTTPException(status_code=404, detail="Food details not found")
+
+            detail_data = orjson.loads(await detail_response.read())
+
+    # Extract nutrients
+    nutrients = extract_comprehensive_nutrients(detail_data.get('foodNutrients', []))
+    return nutrients
+
+# Nutrient mapping with USDA nutrient IDs
+USDA_NUTRIENT_IDS = {
+    # Basic macronutrients
+    'Fat': [1004],  # Total lipid (fat)
+    'Carbohydrates': [1005],  # Carbohydrate, by difference
+    'Protein': [1003],  # Protein
+
+    # Vitamins with proper units
+    'Vitamin_C_mg': [1162],  # Vitamin C, total ascorbic acid (mg)
+    'Vitamin_D_ug': [1114],  # Vitamin D (D2 + D3) (µg)
+    'Vitamin_B12_ug': [1178],  # Vitamin B-12 (µg)
+    'Vitamin_B6_mg': [1175],  # Vitamin B-6 (mg)
+    'Vitamin_A_ug': [1106, 1104],  # Vitamin A, RAE (µg) or IU converted
+    'Vitamin_E_mg': [1109],  # Vitamin E (alpha-tocopherol) (mg)
+    'Vitamin_K_ug': [1185],  # Vitamin K (phylloquinone) (µg)
+    'Folate_ug': [1177, 1186],  # Folate, DFE or total (µg)
+
+    # Minerals
+    'Calcium': [1087],  # Calcium, Ca
+    'Iron': [1089],  # Iron, Fe
+    'Magnesium': [1090],  # Magnesium, Mg
+    'Potassium': [1092],  # Potassium, K
+    'Sodium': [1093],  # Sodium, Na
+    'Zinc': [1095],  # Zinc, Zn
+
+    # Fat breakdown
+    'Saturated_Fat_g': [1258],  # Fatty acids, total saturated (g)
+    'Monounsaturated_Fat_g': [1292],  # Fatty acids, total monounsaturated (g)
+    'Polyunsaturated_Fat_g': [1293],  # Fatty acids, total polyunsaturated (g)
+    'Cholesterol_mg': [1253],  # Cholesterol (mg)
+}
+
+# Reverse lookup: USDA nutrient ID -> nutrient field
+USDA_ID_TO_NUTRIENT = {
+    nutrient_id: nutrient_name
+    for nutrient_name, nutrient_ids in USDA_NUTRIENT_IDS.items()
+    for nutrient_id in nutrient_ids
+}
 
 def extract_comprehensive_nutrients(food_nutrients: List) -> Dict:
     """Extract comprehensive nutrients from USDA response including all specified nutrients"""
-    # Enhanced nutrient mapping with USDA nutrient IDs
-    nutrient_map = {
-        # Basic macronutrients
-        'Fat': [1004],  # Total lipid (fat)
-        'Carbohydrates': [1005],  # Carbohydrate, by difference
-        'Protein': [1003],  # Protein
-
-        # Vitamins with proper units
-        'Vitamin_C_mg': [1162],  # Vitamin C, total ascorbic acid (mg)
-        'Vitamin_D_ug': [1114],  # Vitamin D (D2 + D3) (µg)
-        'Vitamin_B12_ug': [1178],  # Vitamin B-12 (µg)
-        'Vitamin_B6_mg': [1175],  # Vitamin B-6 (mg)
-        'Vitamin_A_ug': [1106, 1104],  # Vitamin A, RAE (µg) or IU converted
-        'Vitamin_E_mg': [1109],  # Vitamin E (alpha-tocopherol) (mg)
-        'Vitamin_K_ug': [1185],  # Vitamin K (phylloquinone) (µg)
-        'Folate_ug': [1177, 1186],  # Folate, DFE or total (µg)
-
-        # Minerals
-        'Calcium': [1087],  # Calcium, Ca
-        'Iron': [1089],  # Iron, Fe
-        'Magnesium': [1090],  # Magnesium, Mg
-        'Potassium': [1092],  # Potassium, K
-        'Sodium': [1093],  # Sodium, Na
-        'Zinc': [1095],  # Zinc, Zn
-
-        # Fat breakdown
-        'Saturated_Fat_g': [1258],  # Fatty acids, total saturated (g)
-        'Monounsaturated_Fat_g': [1292],  # Fatty acids, total monounsaturated (g)
-        'Polyunsaturated_Fat_g': [1293],  # Fatty acids, total polyunsaturated (g)
-        'Cholesterol_mg': [1253],  # Cholesterol (mg)
-    }
+    nutrients = dict.fromkeys(USDA_NUTRIENT_IDS, 0.0)
+    seen = set()
 
-    nutrients = {}
+    # Single pass; the first matching entry for each nutrient wins
+    for food_nutrient in food_nutrients:
+        nutrient_name = USDA_ID_TO_NUTRIENT.get(food_nutrient.get('nutrient', {}).get('id'))
+        if nutrient_name is None or nutrient_name in seen:
+            continue
+        seen.add(nutrient_name)
 
-    for nutrient_name, nutrient_ids in nutrient_map.items():
-        value = 0.0
-        for food_nutrient in food_nutrients:
-            if food_nutrient.get('nutrient', {}).get('id') in nutrient_ids:
-                amount = food_nutrient.get('amount', 0.0)
-                # Handle potential None values
-                if amount is not None:
-                    value = amount
-                break
-        nutrients[nutrient_name] = value
+        amount = food_nutrient.get('amount', 0.0)
+        # Handle potential None values
+        if amount is not None:
+            nutrients[nutrient_name] = amount
 
     return nutrients
 
 def get_mock_comprehensive_nutrients() -> Dict:
     """Mock comprehensive food nutrients for testing"""
+    return dict(zip(MOCK_NUTRIENT_RANGES, _mock_pool_row('nutrients').tolist()))
+
+# Nutrient features, in FoodNutrients field order
+NUTRIENT_NAMES = tuple(FoodNutrients.model_fields)
+
+def build_feature_index(feature_order: List[str]) -> Dict:
+    """Map each model feature to its source so rows can be filled with NumPy scatters"""
+    drug_positions, drug_sources = [], []
+    food_positions, food_keys = [], []
+
+    for position, feature_name in enumerate(feature_order):
+        drug_idx = DRUG_FEATURE_INDEX.get(feature_name)
+        if drug_idx is not None:
+            drug_positions.append(position)
+            drug_sources.append(drug_idx)
+        elif feature_name in NUTRIENT_NAMES:
+            food_positions.append(position)
+            food_keys.append(feature_name)
+        # Anything else stays at the default of 0.0
+
+    # Row positions of the fallback rule inputs (-1 if the model doesn't use them)
+    food_position = dict(zip(food_keys, food_positions))
+
     return {
-        # Basic macronutrients
-        'Fat': np.random.uniform(0, 15),
-        'Carbohydrates': np.random.uniform(0, 40),
-        'Protein': np.random.uniform(0, 20),
-
-        # Vitamins with realistic ranges
-        'Vitamin_C_mg': np.random.uniform(0, 200),  # 0-200 mg
-        'Vitamin_D_ug': np.random.uniform(0, 25),   # 0-25 µg
-        'Vitamin_B12_ug': np.random.uniform(0, 10), # 0-10 µg
-        'Vitamin_B6_mg': np.random.uniform(0, 5),   # 0-5 mg
-        'Vitamin_A_ug': np.random.uniform(0, 1500), # 0-1500 µg
-        'Vitamin_E_mg': np.random.uniform(0, 30),   # 0-30 mg
-        'Vitamin_K_ug': np.random.uniform(0, 500),  # 0-500 µg
-        'Folate_ug': np.random.uniform(0, 300),     # 0-300 µg
-
-        # Minerals
-        'Calcium': np.random.uniform(0, 250),
-        'Iron': np.random.uniform(0, 15),
-        'Magnesium': np.random.uniform(0, 150),
-        'Potassium': np.random.uniform(0, 800),
-        'Sodium': np.random.uniform(0, 200),
-        'Zinc': np.random.uniform(0, 8),
-
-        # Fat breakdown
-        'Saturated_Fat_g': np.random.uniform(0, 10),      # 0-10 g
-        'Monounsaturated_Fat_g': np.random.uniform(0, 8), # 0-8 g
-        'Polyunsaturated_Fat_g': np.random.uniform(0, 6), # 0-6 g
-        'Cholesterol_mg': np.random.uniform(0, 300),      # 0-300 mg
+        'n_features': len(feature_order),
+        'drug_positions': np.array(drug_positions, dtype=np.intp),
+        'drug_sources': np.array(drug_sources, dtype=np.intp),
+        'food_positions': np.array(food_positions, dtype=np.intp),
+        'food_keys': tuple(food_keys),
+        'vitamin_k_position': food_position.get('Vitamin_K_ug', -1),
+        'calcium_position': food_position.get('Calcium', -1)
     }
 
-def predict_interaction(drug_descriptors: Dict, food_nutrients: Dict) -> Dict:
-    """Predict drug-food interaction using loaded models"""
+# Index used when no feature_order is available (drug features, then nutrients)
+DEFAULT_FEATURE_INDEX = build_feature_index(DRUG_FEATURE_NAMES + NUTRIENT_NAMES)
+
+# Model predictions keyed by (canonical SMILES, normalized food name)
+prediction_cache = AsyncTTLCache(maxsize=8192)
+
+def build_feature_row(drug_descriptors: DrugDescriptors, food_nutrients: Dict) -> np.ndarray:
+    """Assemble one model feature row in feature_order"""
+    feature_index = loaded_models.get('feature_index', DEFAULT_FEATURE_INDEX)
+
+    # Kept dense because XGBoost treats entries absent from a sparse matrix
+    # as missing rather than 0, which would change predictions
+    features = np.zeros(feature_index['n_features'], dtype=np.float32)
+    features[feature_index['drug_positions']] = drug_descriptors.as_vector()[feature_index['drug_sources']]
+    features[feature_index['food_positions']] = [food_nutrients.get(key, 0.0) for key in feature_index['food_keys']]
+    return features
+
+async def predict_interaction(drug_descriptors: DrugDescriptors, food_nutrients: Dict, cache_key: Optional[tuple] = None) -> Dict:
+    """Predict drug-food interaction using loaded models
+
+    When cache_key is given, model predictions are memoized under it; fallback
+    predictions are never cached.
+    """
+    if cache_key is not None:
+        cached = prediction_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    features = None
     try:
         # Combine features in the correct order
-        if 'feature_order' in loaded_models:
-            feature_order = loaded_models['feature_order']
-        else:
-            # Default feature order if not available
-            feature_order = list(drug_descriptors.keys()) + list(food_nutrients.keys())
-
-        # Create feature vector
-        features = []
-        for feature_name in feature_order:
-            if feature_name in drug_descriptors:
-                features.append(drug_descriptors[feature_name])
-            elif feature_name in food_nutrients:
-                features.append(food_nutrients[feature_name])
-            else:
-                features.append(0.0)  # Default value for missing features
-
-        feature_array = np.array(features).reshape(1, -1)
+        features = build_feature_row(drug_descriptors, food_nutrients)
 
         # Make prediction
         if 'xgb_model' in loaded_models and 'label_encoder' in loaded_models:
-            model = loaded_models['xgb_model']
             label_encoder = loaded_models['label_encoder']
 
-            # Get prediction probabilities
-            probabilities = model.predict_proba(feature_array)[0]
+            # Get prediction probabilities (batched with concurrent requests)
+            probabilities = await prediction_batcher.submit(features)
             predicted_class_idx = np.argmax(probabilities)
             confidence = probabilities[predicted_class_idx]
 
             # Decode prediction
             predicted_effect = label_encoder.inverse_transform([predicted_class_idx])[0]
 
-            return {
+            prediction = {
                 'effect': predicted_effect,
                 'confidence': float(confidence),
                 'explanation': get_explanation(predicted_effect, confidence)
             }
+            if cache_key is not None:
+                prediction_cache.set(cache_key, prediction)
+            return prediction
         else:
             # Fallback prediction logic
-            return get_fallback_prediction(drug_descriptors, food_nutrients)
+            return get_fallback_prediction(drug_descriptors, food_nutrients, features)
 
     except Exception as e:
         logger.error(f"Error making prediction: {e}")
-        return get_fallback_prediction(drug_descriptors, food_nutrients)
-
-def get_fallback_prediction(drug_descriptors: Dict, food_nutrients: Dict) -> Dict:
-    """Enhanced fallback prediction logic considering specific nutrients"""
-    # Enhanced rule-based prediction considering important nutrients
-    effect = 'no effect'
+        return get_fallback_prediction(drug_descriptors, food_nutrients, features)
+
+async def predict_interactions(inputs: List[tuple], need_confidence: bool = True) -> List[Dict]:
+    """Batch version of predict_interaction
+
+    inputs holds (drug_descriptors, food_nutrients, cache_key) tuples. Cache
+    misses are stacked into one matrix and scored with a single model call;
+    results come back in input order. With need_confidence=False every result
+    has just an 'effect' key.
+    """
+    predictions = [None] * len(inputs)
+    pending = []
+    for i, (_, _, cache_key) in enumerate(inputs):
+        if cache_key is not None:
+            predictions[i] = prediction_cache.get(cache_key)
+        if predictions[i] is None:
+            pending.append(i)
+
+    rows = None
+    if pending and 'xgb_model' in loaded_models and 'label_encoder' in loaded_models:
+        try:
+            label_encoder = loaded_models['label_encoder']
+            rows = [build_feature_row(inputs[i][0], inputs[i][1]) for i in pending]
+
+            if need_confidence:
+                probabilities = await asyncio.to_thread(_predict_proba_rows, rows)
+                class_indices = probabilities.argmax(axis=1)
+                confidences = probabilities[np.arange(len(rows)), class_indices]
+
+                for i, effect, confidence in zip(pending, label_encoder.inverse_transform(class_indices), confidences):
+                    prediction = {
+                        'effect': effect,
+                        'confidence': float(confidence),
+                        'explanation': get_explanation(effect, confidence)
+                    }
+                    predictions[i] = prediction
+                    cache_key = inputs[i][2]
+                    if cache_key is not None:
+                        prediction_cache.set(cache_key, prediction)
+            else:
+                # Class only: skip the probability matrix and argmax
+                class_indices = await asyncio.to_thread(_predict_label_rows, rows)
+                for i, effect in zip(pending, label_encoder.inverse_transform(class_indices)):
+                    predictions[i] = {'effect': effect}
+            pending = []
+        except Exception as e:
+            logger.error(f"Error making batch prediction: {e}")
+
+    # Fallback prediction logic for anything the model did not score
+    for n, i in enumerate(pending):
+        predictions[i] = get_fallback_prediction(inputs[i][0], inputs[i][1], rows[n] if rows is not None else None)
+
+    if not need_confidence:
+        # Cache hits and fallbacks carry the full prediction; keep the shape uniform
+        predictions = [{'effect': prediction['effect']} for prediction in predictions]
+
+    return predictions
+
+# Fallback effects, indexed by _score_fallback's effect_idx
+FALLBACK_EFFECTS = ('no effect', 'possible', 'positive', 'harmful')
+
+@njit(cache=True)
+def _score_fallback(features: np.ndarray, vitamin_k_position: int, calcium_position: int) -> tuple:
+    """Rule-based scoring over a float32 feature row; returns (effect_idx, confidence)"""
+    effect_idx = 0
     confidence = 0.75
 
     # Check for potential vitamin K interactions (common with anticoagulants)
-    if food_nutrients.get('Vitamin_K_ug', 0) > 100:  # High vitamin K
-        effect = 'possible'
+    if features[vitamin_k_position] > 100:  # High vitamin K
+        effect_idx = 1
         confidence = 0.68
 
     # Check for high calcium (may affect absorption)
-    if food_nutrients.get('Calcium', 0) > 150:
-        effect = 'possible' if effect == 'no effect' else effect
+    if features[calcium_position] > 150:
+        if effect_idx == 0:
+            effect_idx = 1
         confidence = max(0.65, confidence)
 
     # Random variation for demonstration
-    effects = ['no effect', 'possible', 'positive', 'harmful']
     if np.random.random() > 0.7:  # 30% chance of different prediction
-        effect = np.random.choice(effects)
+        effect_idx = np.random.randint(0, 4)
         confidence = np.random.uniform(0.6, 0.92)
 
+    return effect_idx, confidence
+
+def get_fallback_prediction(drug_descriptors: DrugDescriptors, food_nutrients: Dict, features: Optional[np.ndarray] = None) -> Dict:
+    """Enhanced fallback prediction logic considering specific nutrients
+
+    features is the caller's assembled model row, if it has one; the rule
+    inputs are then read from it in place instead of from food_nutrients.
+    """
+    feature_index = loaded_models.get('feature_index', DEFAULT_FEATURE_INDEX)
+    vitamin_k_position = feature_index['vitamin_k_position']
+    calcium_position = feature_index['calcium_position']
+
+    if features is None or vitamin_k_position < 0 or calcium_position < 0:
+        # No usable row (e.g. building it failed): score just the two rule inputs
+        features = np.array([food_nutrients.get('Vitamin_K_ug', 0.0), food_nutrients.get('Calcium', 0.0)], dtype=np.float32)
+        vitamin_k_position, calcium_position = 0, 1
+
+    effect_idx, confidence = _score_fallback(features, vitamin_k_position, calcium_position)
+    effect = FALLBACK_EFFECTS[effect_idx]
+
     return {
         'effect': effect,
-        'confidence': confidence,
+        'confidence': float(confidence),
         'explanation': get_explanation(effect, confidence)
     }
 
@@ -497,12 +1044,12 @@ async def get_drug_descriptors(request: DrugRequest):
     smiles = await get_canonical_smiles(request.drug_name)
 
     # Calculate descriptors
-    descriptors = calculate_molecular_descriptors(smiles)
+    descriptors = await calculate_molecular_descriptors(smiles)
 
     return {
         "drug_name": request.drug_name,
         "canonical_smiles": smiles,
-        "descriptors": descriptors
+        "descriptors": descriptors.to_dict()
     }
 
 @app.post("/api/food/nutrients")
@@ -519,34 +1066,29 @@ async def get_food_nutrients_endpoint(request: FoodRequest):
 async def predict_drug_food_interaction(request: InteractionRequest):
     """Predict drug-food interaction using comprehensive nutritional data"""
     try:
-        # Get drug information
-        smiles = await get_canonical_smiles(request.drug_name)
-        drug_descriptors = calculate_molecular_descriptors(smiles)
+        # Fetch drug SMILES and food nutrients concurrently (independent upstream APIs)
+        smiles, (food_nutrients, from_usda) = await asyncio.gather(
+            get_canonical_smiles(request.drug_name),
+            resolve_food_nutrients(request.food_name)
+        )
 
-        # Get comprehensive food nutrients
-        food_nutrients = await search_food_nutrients(request.food_name)
+        # Calculate descriptors in the process pool (RDKit is CPU-bound)
+        drug_descriptors = await calculate_molecular_descriptors(smiles)
 
-        # Make prediction
-        prediction = predict_interaction(drug_descriptors, food_nutrients)
+        # Make prediction (cached per pair unless either input is mock data)
+        cache_key = None
+        if from_usda and not drug_descriptors.is_mock:
+            cache_key = (smiles, normalize_name(request.food_name))
+        prediction = await predict_interaction(drug_descriptors, food_nutrients, cache_key)
 
-        # Prepare response with all nutrient data
-        result = InteractionResult(
+        # Prepare response with all nutrient data; inputs are built internally
+        # with known types, so skip pydantic re-validation
+        result = InteractionResult.model_construct(
             effect=prediction['effect'],
             confidence=prediction['confidence'],
             explanation=prediction['explanation'],
-            drug_properties=MolecularDescriptors(
-                MolWt=drug_descriptors['MolWt'],
-                LogP=drug_descriptors['LogP'],
-                HBA=drug_descriptors['HBA'],
-                HBD=drug_descriptors['HBD'],
-                TPSA=drug_descriptors['TPSA'],
-                RotBonds=drug_descriptors['RotBonds'],
-                RingCount=drug_descriptors['RingCount'],
-                FractionCSP3=drug_descriptors['FractionCSP3'],
-                BalabanJ=drug_descriptors['BalabanJ'],
-                BertzCT=drug_descriptors['BertzCT']
-            ),
-            food_nutrients=FoodNutrients(**food_nutrients)
+            drug_properties=MolecularDescriptors.model_construct(**drug_descriptors.scalars),
+            food_nutrients=FoodNutrients.model_construct(**food_nutrients)
         )
 
         return result
@@ -555,6 +1097,84 @@ async def predict_drug_food_interaction(request: InteractionRequest):
         logger.error(f"Error in prediction endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Upper bound on pairs per batch request; each unique drug/food can trigger upstream lookups
+MAX_BATCH_PAIRS = 100
+
+@app.post("/api/predict/batch")
+async def predict_drug_food_interactions_batch(pairs: List[InteractionRequest], confidence: bool = True):
+    """Predict many drug-food pairs at once, sharing upstream lookups and a single model call"""
+    if len(pairs) > MAX_BATCH_PAIRS:
+        raise HTTPException(status_code=413, detail=f"Too many pairs: {len(pairs)} (maximum {MAX_BATCH_PAIRS})")
+
+    try:
+        drug_keys = [normalize_name(pair.drug_name) for pair in pairs]
+        food_keys = [normalize_name(pair.food_name) for pair in pairs]
+        unique_drugs = list(dict.fromkeys(drug_keys))
+        unique_foods = list(dict.fromkeys(food_keys))
+
+        # All unique NCI and USDA lookups in one gather; failures are reported per pair
+        lookups = await asyncio.gather(
+            *[get_canonical_smiles(drug) for drug in unique_drugs],
+            *[resolve_food_nutrients(food) for food in unique_foods],
+            return_exceptions=True
+        )
+        smiles_map = dict(zip(unique_drugs, lookups[:len(unique_drugs)]))
+        food_map = dict(zip(unique_foods, lookups[len(unique_drugs):]))
+
+        # Descriptors once per unique SMILES
+        unique_smiles = list(dict.fromkeys(smiles for smiles in smiles_map.values() if isinstance(smiles, str)))
+        descriptors = await asyncio.gather(*[calculate_molecular_descriptors(smiles) for smiles in unique_smiles])
+        descriptor_map = dict(zip(unique_smiles, descriptors))
+
+        # One prediction per unique (SMILES, food) pair
+        pair_inputs = {}
+        for drug_key, food_key in zip(drug_keys, food_keys):
+            smiles, food = smiles_map[drug_key], food_map[food_key]
+            if isinstance(smiles, BaseException) or isinstance(food, BaseException):
+                continue
+
+            pair_key = (smiles, food_key)
+            if pair_key not in pair_inputs:
+                food_nutrients, from_usda = food
+                drug_descriptors = descriptor_map[smiles]
+                cache_key = pair_key if from_usda and not drug_descriptors.is_mock else None
+                pair_inputs[pair_key] = (drug_descriptors, food_nutrients, cache_key)
+
+        predictions = await predict_interactions(list(pair_inputs.values()), need_confidence=confidence)
+        prediction_map = dict(zip(pair_inputs, predictions))
+
+        # Zip results back to input order
+        results = []
+        for pair, drug_key, food_key in zip(pairs, drug_keys, food_keys):
+            item = {"drug_name": pair.drug_name, "food_name": pair.food_name}
+            smiles, food = smiles_map[drug_key], food_map[food_key]
+
+            error = next((value for value in (smiles, food) if isinstance(value, BaseException)), None)
+            if error is not None:
+                item["error"] = error.detail if isinstance(error, HTTPException) else str(error)
+            elif not confidence:
+                item["result"] = prediction_map[(smiles, food_key)]
+            else:
+                prediction = prediction_map[(smiles, food_key)]
+                food_nutrients, _ = food
+                item["result"] = InteractionResult.model_construct(
+                    effect=prediction['effect'],
+                    confidence=prediction['confidence'],
+                    explanation=prediction['explanation'],
+                    drug_properties=MolecularDescriptors.model_construct(**descriptor_map[smiles].scalars),
+                    food_nutrients=FoodNutrients.model_construct(**food_nutrients)
+                )
+            results.append(item)
+
+        return {
+            "total": len(results),
+            "results": results
+        }
+
+    except Exception as e:
+        logger.error(f"Error in batch prediction endpoint: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
@@ -566,6 +1186,16 @@ async def health_check():
         "features": "Comprehensive nutritional analysis with vitamins, minerals, and fat breakdown"
     }
 
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """Report hit/miss counts for the lookup, descriptor and prediction caches"""
+    return {
+        "canonical_smiles": fetch_canonical_smiles.cache.stats(),
+        "food_nutrients": fetch_food_nutrients.cache.stats(),
+        "molecular_descriptors": _calc_descriptors_cached.cache.stats(),
+        "predictions": prediction_cache.stats()
+    }
+
 @app.get("/api/nutrients/list")
 async def list_supported_nutrients():
     """List all supported nutrient features"""